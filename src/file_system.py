@@ -1,26 +1,84 @@
+import os
+from abc import abstractmethod
 from base64 import b32encode
+from collections import defaultdict
 from itertools import count
 from pathlib import Path
-from typing import Generator, Iterable, Optional, Set
+from typing import AbstractSet, DefaultDict, Iterable, Iterator, Optional, Set, TypeVar
 
 from pathvalidate import validate_filename
 
+T = TypeVar("T")
+
+
+class FileSystem(AbstractSet[Path]):
+    """A set of paths indexed by parent. The set operators of `AbstractSet` return plain sets."""
+
+    def __new__(cls, paths: Optional[Iterable[Path]] = None, platform: Optional[str] = None):
+        if cls is FileSystem:
+            if paths:  # when some initial paths are provided, the file system is considered as pure
+                cls = PureFileSystem
+            else:  # otherwise, the file system is considered as concrete
+                cls = ConcreteFileSystem
+        return super().__new__(cls)
 
-class FileSystem(set):
     def __init__(self, paths: Optional[Iterable[Path]] = None, platform: Optional[str] = None):
-        if paths:  # when some initial paths are provided, the file system is considered as pure
-            super().__init__(paths)
-            for path in self:
-                validate_filename(
-                    path.name,
-                    platform=platform or "auto",
-                )  # validate each filename when working with a pure FileSystem
-            self.path_exists = lambda path: path in self
-            self.siblings = lambda path: self.children(path.parent)
-        else:  # otherwise, the file system is considered as concrete
-            super().__init__()
-            self.path_exists = lambda path: path.exists()
-            self.siblings = lambda path: path.parent.glob("*")
+        self._paths: Set[Path] = set()
+        # Link each path to all its ancestors, even those absent from the file system (e.g., `/a/b`
+        # for `/a` and `/a/b/c`), so that the descendants of any path can be reached.
+        self._by_parent: DefaultDict[Path, Set[Path]] = defaultdict(set)  # parent -> children
+
+    @classmethod
+    def _from_iterable(cls, elements: Iterable[T]) -> Set[T]:
+        return set(elements)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._paths
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @abstractmethod
+    def path_exists(self, path: Path) -> bool:
+        pass
+
+    @abstractmethod
+    def siblings(self, path: Path) -> Iterator[Path]:
+        pass
+
+    def add(self, path: Path) -> None:
+        self._paths.add(path)
+        while path.parent != path:  # stop at the root, or at "." for a relative path
+            children = self._by_parent[path.parent]
+            if path in children:  # its ancestors are already linked too
+                break
+            children.add(path)
+            path = path.parent
+
+    def discard(self, path: Path) -> None:
+        self._paths.discard(path)
+        while path not in self._paths and path not in self._by_parent and path.parent != path:
+            children = self._by_parent.get(path.parent)
+            if children is None:  # the path was not linked
+                break
+            children.discard(path)
+            if children:
+                break
+            del self._by_parent[path.parent]  # unlink its parent too, unless it is a member
+            path = path.parent
+
+    def remove(self, path: Path) -> None:
+        if path not in self._paths:
+            raise KeyError(path)
+        self.discard(path)
+
+    def update(self, *iterables: Iterable[Path]) -> None:
+        for paths in iterables:
+            for path in paths:
+                self.add(path)
 
     def update_with_source_paths(self, source_paths: Iterable[Path]) -> None:
         """Check all paths exist in the file system and "close" it with their siblings.
@@ -32,16 +90,18 @@ class FileSystem(set):
             FileNotFoundError: a source path is absent from the file system.
         """
         result: Set[Path] = set()
+        visited_parents: Set[Path] = set()
         for source_path in source_paths:
             if not self.path_exists(source_path):
                 raise FileNotFoundError(source_path)
-            result.update(self.siblings(source_path))
+            result.add(source_path)  # even when its siblings cannot be enumerated
+            if source_path.parent not in visited_parents:  # enumerate each family only once
+                visited_parents.add(source_path.parent)
+                result.update(self.siblings(source_path))
         self.update(result)  # should not change a pure file system
 
-    def children(self, path: Path) -> Generator[Path, None, None]:
-        for candidate in self:
-            if candidate.match(f"{path}/*"):
-                yield candidate
+    def children(self, path: Path) -> Iterator[Path]:
+        return (child for child in self._by_parent.get(path, ()) if child in self._paths)
 
     def non_existing_sibling(self, path: Path) -> Path:
         """Create the path of a non-existing sibling of a given path.
@@ -62,14 +122,14 @@ class FileSystem(set):
             - Truncated SHA-256 and BASE-64 were considered, but the former is overkill, and the
             character set of the latter is not appropriate for filenames.
         """
-        digest = b32encode(path.name.encode("utf8")).decode("ascii")[:32]
+        digest = b32encode(path.name.encode("utf8")[:20]).decode("ascii")  # 20 bytes -> 32 chars
         for suffix in count():
             new_path = path.with_name(f"{digest}-{suffix}")
-            if new_path not in self:
+            if new_path not in self._paths:
                 break
         return new_path
 
-    def rename(self, path, new_path):
+    def rename(self, path: Path, new_path: Path) -> None:
         """Rename a path into a new path, and rename recursively its descendants.
 
         The following preconditions are normally satisfied:
@@ -88,9 +148,49 @@ class FileSystem(set):
                 Nevertheless, all the consequences of a renaming (specifically, of a folder) are
                 simulated to ensure testability.
             - In a virtual file system, renaming a node before its parent is not mandatory.
+            - Only `path` and its descendants are visited, regardless of the size of the file
+                system.
         """
-        offset = len(str(path)) + 1
-        for candidate in list(self):
-            if candidate == path or str(candidate).startswith(f"{path}/"):
-                self.remove(candidate)
-                self.add(new_path / str(candidate)[offset:])
+        offset = len(path.parts)
+        candidates = []
+        stack = [path]
+        while stack:
+            candidate = stack.pop()
+            stack.extend(self._by_parent.get(candidate, ()))
+            if candidate in self._paths:
+                candidates.append(candidate)
+        for candidate in candidates:
+            self.remove(candidate)
+        for candidate in candidates:
+            self.add(new_path.joinpath(*candidate.parts[offset:]))
+
+
+class PureFileSystem(FileSystem):
+    def __init__(self, paths: Iterable[Path], platform: Optional[str] = None):
+        super().__init__()
+        self.update(paths)
+        for path in self:
+            validate_filename(
+                path.name,
+                platform=platform or "auto",
+            )  # validate each filename when working with a pure FileSystem
+
+    def path_exists(self, path: Path) -> bool:
+        return path in self
+
+    def siblings(self, path: Path) -> Iterator[Path]:
+        return self.children(path.parent)
+
+
+class ConcreteFileSystem(FileSystem):
+    def path_exists(self, path: Path) -> bool:
+        return os.path.lexists(path)  # like `paths_to_inodes_paths()`, do not follow symlinks
+
+    def siblings(self, path: Path) -> Iterator[Path]:
+        """Enumerate the actual siblings of a given path, if its parent is readable."""
+        try:
+            with os.scandir(path.parent) as entries:
+                for entry in entries:
+                    yield Path(entry.path)
+        except PermissionError:  # e.g., a write-only parent, whose items can still be renamed
+            return
@@ -1,6 +1,9 @@
 import re
+from functools import lru_cache
 from pathlib import Path
+from shlex import quote, split
 from shutil import which
+from typing import List
 
 from src.user_errors import *
 from src.context import Context
@@ -16,7 +19,8 @@ def get_editor_command(
         context: all data relative to the current execution context (platform, logger, etc.).
         editable_file_path: the path to the text file to edit.
     Returns:
-        A string representing the complete command to open this file in a text editor.
+        A string representing the complete command to open this file in a text editor, to be
+        split by `split_command()`.
     Raises:
         NoEditorCommandsFileError: if `editor_commands.md` is not found.
         NoEditorError: if no command-line capable editor is installed.
@@ -25,9 +29,9 @@ def get_editor_command(
     # Check whether the user has defined a favorite editor and it is installed.
     command = context.config.get("editor_command")
     if command:
-        name = str(command).partition(" ")[0]  # make mypy happy
+        name = command.partition(" ")[0]
         if context.platform == "mockOS" or which(name):  # https://stackoverflow.com/a/34177358/173003
-            return f"{command} {editable_file_path}"
+            return f"{command} {quote_path(editable_file_path, context.platform)}"
         else:
             raise UninstalledFavoriteEditorError(
                 f"The command '{name}' is not found. "
@@ -35,6 +39,27 @@ def get_editor_command(
                 f"or modify it in '{context.workspace / 'config.json'}'."
             )
 
+    # Otherwise, fall back to the first known command installed on the current platform.
+    return f"{get_default_command(context.platform)} {quote_path(editable_file_path, context.platform)}"
+
+
+@lru_cache(maxsize=None)
+def get_default_command(
+    platform: str,
+    get_known_commands=re.compile(r"(?m)^\|[^|\n]+\|([^|\n]*)\| *`([^`\n]+)` *\|").findall,
+) -> str:
+    """
+    Retrieve the first known editor command which is installed on a given platform.
+    Args:
+        platform: the name of the current platform.
+        get_known_commands: extract the (platforms, command) couples from `editor_commands.md`.
+    Returns:
+        A string representing the command, without the path of the file to edit. Since it is
+        not expected to change during an execution, the result is cached.
+    Raises:
+        NoEditorCommandsFileError: if `editor_commands.md` is not found.
+        NoEditorError: if no command-line capable editor is installed.
+    """
     # Retrieve a list of known editor commands.
     for editor_commands_folder in (".", "src"):
         editor_commands_path = Path(editor_commands_folder) / "editor_commands.md"
@@ -45,11 +70,42 @@ def get_editor_command(
         raise NoEditorCommandsFileError(f"The file 'editor_commands.md' is not found.")
 
     # Among the commands known to work on the current platform, return the first one that is installed.
-    supported_commands = r"(?m)^\|.+?\|.*?%s.*?\| *`(.+?)` *\|" % context.platform
-    for command in re.findall(supported_commands, text):
-        name = str(command).partition(" ")[0]  # make mypy happy
-        if context.platform == "mockOS" or which(name):  # https://stackoverflow.com/a/34177358/173003
-            return f"{command} {editable_file_path}"
+    for (platforms, command) in get_known_commands(text):
+        if platform not in platforms:
+            continue
+        name = command.partition(" ")[0]
+        if platform == "mockOS" or which(name):  # https://stackoverflow.com/a/34177358/173003
+            return command
 
     # If no known command is installed, raise an error.
-    raise NoEditorError(f"No text editor found for the platform {context.platform}.")
+    raise NoEditorError(f"No text editor found for the platform {platform}.")
+
+
+def quote_path(path: Path, platform: str) -> str:
+    """Quote a path so that `split_command()` gives it back as a single argument."""
+    if platform == "Windows":  # Windows paths cannot contain double quotes
+        return f'"{path}"'
+    return quote(str(path))
+
+
+def split_command(command: str, platform: str) -> List[str]:
+    """
+    Split a command into a list of arguments, to be run without a shell.
+    Args:
+        command: a command, as returned by `get_editor_command()`.
+        platform: the name of the current platform.
+    Returns:
+        The list of the arguments, the first one being resolved into the path of the executable
+        when it is found (e.g., `code` into the path of `code.cmd` on Windows).
+    """
+    if platform == "Windows":  # backslashes are path separators, not escape characters
+        args = []
+        for arg in split(command, posix=False):  # the quotes are kept around the arguments
+            if len(arg) > 1 and arg[0] == arg[-1] and arg[0] in "'\"":
+                arg = arg[1:-1]
+            args.append(arg)
+    else:
+        args = split(command)
+    if args:
+        args[0] = which(args[0]) or args[0]
+    return args
@@ -1,5 +1,7 @@
+import os
+from collections import defaultdict
 from pathlib import Path
-from typing import List
+from typing import DefaultDict, Dict, List
 
 from src.user_errors import NoItemToRenameError
 from src.user_types import Inode, InodesPaths
@@ -18,14 +20,33 @@ def paths_to_inodes_paths(paths: List[Path]) -> InodesPaths:
 
     Returns:
         A mapping from inodes to paths.
+
+    Note:
+        The siblings are looked up in a single scan of their parent directory. Isolated paths,
+        or paths not found among the entries of their parent (e.g., `.`), are stat'ed one by one.
+        In both cases, symbolic links are not followed.
     """
+    paths_by_parent: DefaultDict[Path, Dict[str, Path]] = defaultdict(dict)
+    for path in paths:
+        paths_by_parent[path.parent][path.name] = path
     result = {}
     missing_paths = []
-    for path in paths:
-        if path.exists():
-            result[Inode(path.stat().st_ino)] = path
-        else:
-            missing_paths.append(path)
+    for (parent, paths_by_name) in paths_by_parent.items():
+        if len(paths_by_name) > 1:
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        if entry.name in paths_by_name:
+                            result[Inode(entry.inode())] = paths_by_name.pop(entry.name)
+                            if not paths_by_name:  # stop reading a potentially large directory
+                                break
+            except OSError:  # e.g., a parent not readable: the remaining paths are stat'ed below
+                pass
+        for path in paths_by_name.values():
+            try:
+                result[Inode(os.stat(path, follow_symlinks=False).st_ino)] = path
+            except (FileNotFoundError, NotADirectoryError):
+                missing_paths.append(path)
     if missing_paths:
         n = len(missing_paths)
         raise FileNotFoundError(f"{n} missing item{'s'[:n^1]}: {list(map(str,missing_paths))}.")
@@ -2,19 +2,12 @@ import subprocess
 import sys
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import List, Dict, Any
 
 sys.path[0:0] = ["."]
 
-from src.file_system import FileSystem
-from src.get_editable_text import get_editable_text
-from src.get_editor_command import get_editor_command
 from src.context import Context
-from src.parse_edited_text import parse_edited_text
-from src.paths_to_inodes_paths import paths_to_inodes_paths
 from src.renamings import Renamer
-from src.secure_clauses import secure_clauses
 from src.user_errors import *
 from src.user_types import EditedText
 
@@ -61,6 +54,16 @@ def undo_renamings(context: Context):
 
 
 def do_renamings(context: Context, **kwargs):
+    # Imported here, since these modules are not needed for undoing.
+    from tempfile import NamedTemporaryFile
+
+    from src.file_system import ConcreteFileSystem
+    from src.get_editable_text import get_editable_text
+    from src.get_editor_command import get_editor_command, split_command
+    from src.parse_edited_text import parse_edited_text
+    from src.paths_to_inodes_paths import paths_to_inodes_paths
+    from src.secure_clauses import secure_clauses
+
     logger = context.logger
     print_ = context.print_
     logger.info("Constructing the list of items to rename.")
@@ -71,16 +74,17 @@ def do_renamings(context: Context, **kwargs):
         paths.extend(map(Path, kwargs["paths"]))
     else:  # `do_renamings` cannot be called without at least one path. So there is exactly one.
         single_path = Path(kwargs["paths"][0])
-        logger.info(f"A single path is provided: {single_path}.")
+        logger.info("A single path is provided: %s.", single_path)
         if single_path.is_dir():
-            logger.info(f"It is a directory: it and its children are to be renamed.")
+            logger.info("It is a directory: it and its children are to be renamed.")
             paths.append(single_path)
             paths.extend(single_path.iterdir())
         elif single_path.is_file() and single_path.suffix == ".txt":
-            logger.info(f"It is a text file containing the paths of the items to rename.")
-            paths.extend(map(Path, filter(None, single_path.read_text().splitlines())))
+            logger.info("It is a text file containing the paths of the items to rename.")
+            with single_path.open() as lines:  # stream the lines instead of reading the whole file
+                paths.extend(map(Path, filter(None, (line.rstrip("\r\n") for line in lines))))
         else:
-            logger.info(f"It is either a missing or a non-text file: default to rename it.")
+            logger.info("It is either a missing or a non-text file: default to rename it.")
             paths.append(single_path)
             # The case of a missing single file will be catched by `paths_to_inodes_paths()`.
 
@@ -91,52 +95,51 @@ def do_renamings(context: Context, **kwargs):
     except Exception as e:
         return print_.abort(str(e))
 
-    logger.info("Creating a temporary text file for the list to be edited.")
-    try:
-        editable_file_path = Path(NamedTemporaryFile(mode="w+", delete=False, suffix=".tsv").name)
-        logger.info(f"Editable file path: {repr(editable_file_path)}.")
-    except Exception as e:
-        return print_.abort(f"Failed to create a temporary file: {e}")
-
-    logger.info("Populating the temporary text file with the list to be edited.")
+    logger.info("Creating and populating a temporary text file with the list to be edited.")
     try:
-        editable_file_path.write_text(get_editable_text(inodes_paths))
-        logger.info(f"Editable file content: populated.")
+        with NamedTemporaryFile(mode="w", delete=False, suffix=".tsv", encoding="utf-8") as file:
+            editable_file_path = Path(file.name)
+            logger.info("Editable file path: %r.", editable_file_path)
+            file.write(get_editable_text(inodes_paths))
+        logger.info("Editable file content: populated.")
     except Exception as e:
-        return print_.abort(f"Failed to populate the temporary file: {e}")
+        return print_.abort(f"Failed to create or populate the temporary file: {e}")
 
     logger.info("Retrieving a command to edit the temporary text file.")
     try:
         editor_command = get_editor_command(context, editable_file_path)
-        logger.info(f"The command is {editor_command}.")
+        logger.info("The command is %s.", editor_command)
     except Exception as e:
         return print_.abort(str(e))
 
     logger.info("Opening the editable text file in the editor and waiting it to be closed.")
     try:
-        subprocess.run(editor_command, shell=True, check=True)
+        subprocess.run(split_command(editor_command, context.platform), check=True)
         logger.info("Command executed without process error.")
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         return print_.abort(f"The command '{editor_command}' failed.")
 
     logger.info("Retrieving the content of the edited text file.")
     try:
-        edited_text = EditedText(editable_file_path.read_text())
-        logger.info("Line count in the edited text file: %s." % edited_text.count("\n"))
+        edited_bytes = editable_file_path.read_bytes()
+        logger.info("Line count in the edited text file: %s.", edited_bytes.count(b"\n"))
+        edited_text = EditedText(  # translate the newlines as `read_text()` would (e.g., CRLF)
+            edited_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        )
     except Exception as e:
         return print_.abort(f"Failed to read the edited text file: {e}")
 
     logger.info("Parsing the edited text into renaming clauses.")
     try:
         clauses = parse_edited_text(edited_text, inodes_paths)
-        logger.info(f"Parsed edited text into {len(clauses)} clauses.")
+        logger.info("Parsed edited text into %s clauses.", len(clauses))
     except Exception as e:
         return print_.abort(str(e))
 
     logger.info("Converting the clauses into a “safe” sequence of renamings.")
     try:
-        arcs = secure_clauses(FileSystem(), clauses)
-        logger.info(f"Converted clauses into {len(arcs)} arcs.")
+        arcs = secure_clauses(ConcreteFileSystem(), clauses)
+        logger.info("Converted clauses into %s arcs.", len(arcs))
     except Exception as e:
         return print_.abort(str(e))
 
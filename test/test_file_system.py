@@ -4,7 +4,7 @@ import pytest
 from pathvalidate import ValidationError
 
 __import__("sys").path[0:0] = "."
-from src.file_system import FileSystem
+from src.file_system import ConcreteFileSystem, FileSystem, PureFileSystem
 
 
 @pytest.fixture(scope="module")
@@ -19,6 +19,8 @@ def fs(paths):
 
 def test_constructor(fs):
     assert Path("/usr/local") in fs
+    assert isinstance(fs, PureFileSystem)
+    assert isinstance(FileSystem(), ConcreteFileSystem)
 
 
 path_and_platform_data = [
@@ -46,6 +48,20 @@ def test_update_with_source_paths_concrete():
     assert Path("./test/test_file_system.py") not in fs  # child of a sibling of `.`
 
 
+def test_update_with_source_paths_concrete_unreadable_parent(monkeypatch):
+    def scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr("os.scandir", scandir)
+    fs = FileSystem()
+    paths = [
+        Path("./src/goodies.py"),
+        Path("./src/file_system.py"),
+    ]
+    fs.update_with_source_paths(paths)
+    assert set(fs) == set(paths)  # the siblings are unknown, but the source paths exist
+
+
 def test_update_with_source_paths_not_existing(fs):
     paths = [
         Path("/foo/bar"),
@@ -74,6 +90,15 @@ def test_children(fs):
     assert result == expected
 
 
+def test_children_after_mutations(fs):
+    fs.add(Path("/mnt/toaster"))
+    fs.remove(Path("/mnt/floppy"))
+    fs.discard(Path("/mnt/cdrom"))
+    fs.update([Path("/mnt/usb")], [Path("/mnt/tape")])
+    result = set(map(str, fs.children(Path("/mnt"))))
+    assert result == {"/mnt/toaster", "/mnt/usb", "/mnt/tape"}
+
+
 def test_siblings(fs):
     expected = {
         Path("/usr/X11R6"),
@@ -142,5 +167,21 @@ def test_rename_internal_node(fs):
     }
 
 
+def test_rename_internal_node_children(fs):
+    fs.rename(Path("/usr/X11R6"), Path("/usr/foobar"))
+    assert set(fs.children(Path("/usr/X11R6"))) == set()
+    assert set(fs.children(Path("/usr/foobar/lib"))) == {Path("/usr/foobar/lib/tls")}
+    assert Path("/usr/foobar") in set(fs.children(Path("/usr")))
+
+
+def test_rename_node_with_missing_intermediate_folder():
+    fs = FileSystem([Path("/a"), Path("/a/b/c")])
+    assert set(fs.children(Path("/a"))) == set()  # `/a/b` is not in the file system
+    fs.rename(Path("/a"), Path("/z"))
+    assert set(fs) == {Path("/z"), Path("/z/b/c")}
+    assert set(fs.children(Path("/z/b"))) == {Path("/z/b/c")}
+    assert set(fs.children(Path("/a/b"))) == set()
+
+
 if __name__ == "__main__":  # pragma: no cover
     pytest.main(["-qq", __import__("sys").argv[0]])
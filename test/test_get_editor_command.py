@@ -1,3 +1,5 @@
+import shutil
+
 import pytest
 
 __import__("sys").path[0:0] = "."
@@ -25,5 +27,38 @@ def test_with_mock_os():
     assert get_editor_command(context, Path("foobar")) == "mock_default_command foobar"
 
 
+def test_with_space_in_path():
+    config_path = Path("test") / "workspace" / "config.json"
+    if config_path.exists():
+        config_path.unlink()
+    context = Context("mockOS")
+    command = get_editor_command(context, Path("foo bar"))
+    assert split_command(command, "mockOS") == ["mock_default_command", "foo bar"]
+
+
+def test_split_command_on_windows():
+    command = r"C:\Windows\notepad.exe -m"
+    path = Path("C:/Users/foo bar/tmp.tsv")
+    result = split_command(f"{command} {quote_path(path, 'Windows')}", "Windows")
+    assert result == [r"C:\Windows\notepad.exe", "-m", str(path)]
+
+
+def test_split_command_on_windows_with_quotes():
+    command = r"'C:\Program Files\Notepad\notepad.exe' -multiInst"
+    result = split_command(command, "Windows")
+    assert result == [r"C:\Program Files\Notepad\notepad.exe", "-multiInst"]
+
+
+def test_split_command_resolves_executable():
+    assert split_command("python -V", "Linux")[0] == shutil.which("python")
+
+
+def test_default_command_is_cached():
+    get_default_command.cache_clear()
+    assert get_default_command("mockOS") == "mock_default_command"
+    assert get_default_command("mockOS") == "mock_default_command"
+    assert get_default_command.cache_info().hits == 1
+
+
 if __name__ == "__main__":  # pragma: no cover
     pytest.main(["-qq", __import__("sys").argv[0]])
@@ -16,14 +16,31 @@ def test_existing_paths_to_inodes_paths():
     assert set(result.values()) == set(paths)
 
 
+def test_siblings_paths_to_inodes_paths():
+    paths = [Path("src")] + list(Path("src").iterdir())
+    result = paths_to_inodes_paths(paths)
+    assert result == {path.lstat().st_ino: path for path in paths}
+
+
+def test_unreadable_parent_paths_to_inodes_paths(monkeypatch):
+    def scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr("os.scandir", scandir)
+    paths = list(Path("src").iterdir())
+    result = paths_to_inodes_paths(paths)
+    assert result == {path.lstat().st_ino: path for path in paths}
+
+
 def test_non_existing_paths_to_inodes_paths():
     paths = [
         Path("src/paths_to_inodes_paths.py"),
         Path("missing_file_1.txt"),
         Path("missing_file_2.txt"),
     ]
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError) as error:
         paths_to_inodes_paths(paths)
+    assert error.value.args[0] == "2 missing items: ['missing_file_1.txt', 'missing_file_2.txt']."
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+__import__("sys").path[0:0] = "."
+from src.context import Context
+from src.suprenam import do_renamings
+
+
+def do_renamings_with_mock_editor(tmp_path: Path, paths: List[Path], edition: str):
+    """Run `do_renamings()` with a mock editor script executing `edition` on the edited `text`."""
+    editor_path = tmp_path / "editor.py"
+    editor_path.write_text(
+        "import sys\n"
+        "from pathlib import Path\n"
+        "path = Path(sys.argv[1])\n"
+        "text = path.read_text(encoding='utf-8')\n"
+        f"{edition}\n"
+    )
+    config_path = Path("test") / "workspace" / "config.json"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    editor_command = f"{Path(sys.executable).as_posix()} {editor_path.as_posix()}"
+    config_path.write_text('{"editor_command": "%s"}' % editor_command)
+    try:
+        context = Context("mockOS")
+        context.logger.create_new_log_file()
+        do_renamings(context, paths=list(map(str, paths)))
+    finally:
+        config_path.unlink()
+
+
+def test_do_renamings_with_crlf_edited_text(tmp_path):
+    (tmp_path / "foo").touch()
+    (tmp_path / "bar").touch()
+    do_renamings_with_mock_editor(
+        tmp_path,
+        [tmp_path / "foo", tmp_path / "bar"],
+        "text = text.replace('\\tfoo', '\\tfoobar')\n"
+        "path.write_bytes(text.replace('\\n', '\\r\\n').encode('utf-8'))",  # save with CRLF
+    )
+    assert {path.name for path in tmp_path.iterdir()} == {"foobar", "bar", "editor.py"}
+
+
+def test_do_renamings_with_dangling_symlink(tmp_path):
+    (tmp_path / "foo").touch()
+    (tmp_path / "link").symlink_to(tmp_path / "missing")
+    do_renamings_with_mock_editor(
+        tmp_path,
+        [tmp_path / "foo", tmp_path / "link"],
+        "path.write_text(text.replace('\\tlink', '\\tnew_link'), encoding='utf-8')",
+    )
+    assert {path.name for path in tmp_path.iterdir()} == {"foo", "new_link", "editor.py"}
+    assert (tmp_path / "new_link").is_symlink()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    pytest.main(["-qq", __import__("sys").argv[0]])